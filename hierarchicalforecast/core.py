@@ -1,9 +1,13 @@
 __all__ = ['HierarchicalReconciliation']
 
 
+import copy
+import functools
+import os
 import re
 import reprlib
 import time
+from concurrent.futures import ThreadPoolExecutor
 from inspect import signature
 
 import narwhals.stable.v2 as nw
@@ -125,6 +129,9 @@ def _aggregate_diagnostics(
     return df.to_native()
 
 
+_FN_NAME_ARGS_TO_REMOVE = frozenset(["insample", "num_threads"])
+
+
 def _build_fn_name(fn) -> str:
     fn_name = type(fn).__name__
     # Use _init_params if available, otherwise fall back to __dict__ for backwards compatibility
@@ -133,13 +140,13 @@ def _build_fn_name(fn) -> str:
         func_params = fn.__dict__
 
     # Take default parameter out of names
-    args_to_remove = ["insample", "num_threads"]
+    args_to_remove = _FN_NAME_ARGS_TO_REMOVE
     if not func_params.get("nonnegative", False):
-        args_to_remove.append("nonnegative")
+        args_to_remove = args_to_remove | {"nonnegative"}
 
     if fn_name == "MinTrace" and func_params.get("method") == "mint_shrink":
         if func_params.get("mint_shr_ridge") == 2e-8:
-            args_to_remove.append("mint_shr_ridge")
+            args_to_remove = args_to_remove | {"mint_shr_ridge"}
 
     func_params = [
         f"{name}-{value}"
@@ -151,11 +158,126 @@ def _build_fn_name(fn) -> str:
     return fn_name
 
 
+def _frame_to_csr(S_nw: Frame) -> sparse.csr_matrix:
+    """Build a CSR summing matrix from a dense frame, one column at a time.
+
+    Only the non-zero entries of each column are collected, so the dense
+    ``(n_series, n_bottom)`` array is never allocated.
+
+    Args:
+        S_nw: Narwhals frame with the summing matrix values (without id column).
+
+    Returns:
+        Summing matrix of shape (``n_series``, ``n_bottom``) in CSR format.
+    """
+    rows, cols, data = [], [], []
+    for j, col in enumerate(S_nw.columns):
+        values = S_nw[col].to_numpy()
+        nonzero_rows = np.flatnonzero(values)
+        rows.append(nonzero_rows)
+        cols.append(np.full(len(nonzero_rows), j, dtype=np.intp))
+        data.append(values[nonzero_rows].astype(np.float64, copy=False))
+
+    return sparse.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=S_nw.shape,
+    )
+
+
+def _tags_to_positions(
+    S_nw: Frame,
+    tags: dict[str, np.ndarray],
+    id_col: str = "unique_id",
+) -> dict[str, np.ndarray]:
+    """Map each tag to the row positions of its series in S.
+
+    All tag values are resolved with a single join against the row index of S,
+    so the lookup runs in the dataframe backend rather than in Python.
+
+    Args:
+        S_nw: Narwhals frame with the summing matrix, rows in reconciliation order.
+        tags: Each key is a level and its value contains tags associated to that level.
+        id_col: Column that identifies each serie.
+
+    Returns:
+        Dictionary with the sorted and unique row positions in S of each level.
+    """
+    if not tags:
+        return {}
+    tag_values = [np.asarray(val) for val in tags.values()]
+    tags_nw = nw.from_dict(
+        {
+            id_col: np.concatenate(tag_values),
+            "tag": np.repeat(np.arange(len(tag_values)), [len(val) for val in tag_values]),
+        },
+        backend=nw.get_native_namespace(S_nw),
+    ).with_columns(nw.col(id_col).cast(S_nw.schema[id_col]))
+    tags_nw = tags_nw.join(
+        S_nw.select(id_col).with_row_index(name=f"{id_col}_id"), on=id_col, how="inner"
+    )
+    tag_idx = tags_nw["tag"].to_numpy()
+    positions = tags_nw[f"{id_col}_id"].to_numpy().astype(np.intp, copy=False)
+
+    return {key: np.unique(positions[tag_idx == i]) for i, key in enumerate(tags)}
+
+
+_PI_COL_RE = re.compile(r"^(.+)-(lo|hi)-(.+)$")
+
+
+@functools.lru_cache(maxsize=None)
+def _level_to_z(level: float) -> float:
+    """Standard normal quantile bounding a central interval of the given level."""
+    return float(norm.ppf(0.5 + level / 200))
+
+
+def _get_pi_columns(
+    columns: list[str],
+    model_names: list[str],
+) -> dict[str, dict[float, tuple[str, str]]]:
+    """Map each model to its paired prediction interval columns.
+
+    Scans ``columns`` a single time and pairs every ``{model_name}-lo-{level}``
+    column with its ``{model_name}-hi-{level}`` counterpart.
+
+    Args:
+        columns: Column names of the base forecasts DataFrame.
+        model_names: Names of the forecast models.
+
+    Returns:
+        Dictionary ``{model_name: {level: (lo_col, hi_col)}}`` with levels sorted
+        in ascending order. Models without paired columns map to an empty dict.
+    """
+    models = set(model_names)
+    lo_cols: dict[str, dict[float, str]] = {model_name: {} for model_name in model_names}
+    hi_cols: dict[str, dict[float, str]] = {model_name: {} for model_name in model_names}
+    for col in columns:
+        level_match = _PI_COL_RE.match(col)
+        if level_match is None:
+            continue
+        model_name, direction, level_str = level_match.groups()
+        if model_name not in models:
+            continue
+        level = float(level_str)
+        if direction == "lo":
+            lo_cols[model_name][level] = col
+        else:
+            hi_cols[model_name][level] = col
+
+    return {
+        model_name: {
+            level: (lo_cols[model_name][level], hi_cols[model_name][level])
+            for level in sorted(lo_cols[model_name].keys() & hi_cols[model_name].keys())
+        }
+        for model_name in model_names
+    }
+
+
 def _estimate_sigmah(
     Y_hat_df: Frame,
     y_hat: np.ndarray,
     model_name: str,
     id_col: str = "unique_id",
+    pi_columns: dict[float, tuple[str, str]] | None = None,
 ) -> np.ndarray:
     r"""Estimate forecast standard deviation from paired prediction intervals.
 
@@ -173,7 +295,9 @@ def _estimate_sigmah(
         Y_hat_df: DataFrame with base forecasts and prediction interval columns.
         y_hat: Point forecasts of shape (``n_series``, ``n_horizon``).
         model_name: Name of the forecast model (used to find PI columns).
-        id_col: Column name for series identifiers.
+        id_col: Column name for series identifiers. Unused, series are counted from ``y_hat``.
+        pi_columns: Paired PI columns of the model as returned by ``_get_pi_columns``.
+            If None, they are looked up in ``Y_hat_df``.
 
     Returns:
         Estimated forecast standard deviations of shape (``n_series``, ``n_horizon``).
@@ -181,28 +305,12 @@ def _estimate_sigmah(
     Raises:
         ValueError: If no paired prediction interval columns are found.
     """
-    n_series = Y_hat_df[id_col].n_unique()
-
-    # Find all lo/hi PI columns for this model
-    lo_cols = {}
-    hi_cols = {}
-    for col in Y_hat_df.columns:
-        if not col.startswith(model_name + "-"):
-            continue
-        suffix = col[len(model_name) + 1 :]
-        level_match = re.match(r"^(lo|hi)-(.+)$", suffix)
-        if level_match is None:
-            continue
-        direction, level_str = level_match.groups()
-        level = float(level_str)
-        if direction == "lo":
-            lo_cols[level] = col
-        else:
-            hi_cols[level] = col
+    # y_hat is already aligned to the series, avoid hashing the id column to count them
+    n_series = y_hat.shape[0]
 
-    # Collect paired levels
-    paired_levels = sorted(lo_cols.keys() & hi_cols.keys())
-    if not paired_levels:
+    if pi_columns is None:
+        pi_columns = _get_pi_columns(Y_hat_df.columns, [model_name])[model_name]
+    if not pi_columns:
         raise ValueError(
             f"No paired prediction interval columns found for `{model_name}`. "
             f"Expected columns like `{model_name}-lo-90` and `{model_name}-hi-90`."
@@ -210,10 +318,10 @@ def _estimate_sigmah(
 
     # Estimate sigma_h from each paired level and average
     sigma_estimates = []
-    for level in paired_levels:
-        lo = Y_hat_df[lo_cols[level]].to_numpy().reshape(n_series, -1)
-        hi = Y_hat_df[hi_cols[level]].to_numpy().reshape(n_series, -1)
-        z = norm.ppf(0.5 + level / 200)
+    for level, (lo_col, hi_col) in pi_columns.items():
+        lo = Y_hat_df[lo_col].to_numpy().reshape(n_series, -1)
+        hi = Y_hat_df[hi_col].to_numpy().reshape(n_series, -1)
+        z = _level_to_z(level)
         sigma_estimates.append((hi - lo) / (2 * z))
 
     sigmah = np.mean(sigma_estimates, axis=0)
@@ -233,14 +341,21 @@ class HierarchicalReconciliation:
 
     Args:
         - reconcilers (list[HReconciler]): A list of instantiated classes of the [reconciliation methods](./methods.html) module.
+        - n_jobs (int): Number of threads used to reconcile the models of each reconciler. Use -1 for all cores. Default is 1.
 
     References:
         - [Rob J. Hyndman and George Athanasopoulos (2018). "Forecasting principles and practice, Hierarchical and Grouped Series"](https://otexts.com/fpp3/hierarchical.html).
 
     """
 
-    def __init__(self, reconcilers: list[HReconciler]):
+    def __init__(self, reconcilers: list[HReconciler], n_jobs: int = 1):
         self.reconcilers = reconcilers
+        self.n_jobs = n_jobs
+        # Reconcilers that don't record their parameters get a shallow snapshot taken before any fit,
+        # so their names aren't built from (and don't copy) fitted state such as P, W or the sampler
+        for reconciler in self.reconcilers:
+            if getattr(reconciler, "_init_params", None) is None:
+                reconciler._init_params = dict(reconciler.__dict__)
 
     def _prepare_fit(
         self,
@@ -318,26 +433,24 @@ class HierarchicalReconciliation:
                 )
 
         # Check if Y_hat_df has the right shape
-        if len(Y_hat_nw.group_by(id_col).agg(nw.len()).unique(subset="len")) != 1:
+        series_lengths = Y_hat_nw.group_by(id_col).agg(nw.len())["len"].to_numpy()
+        if series_lengths.size == 0 or series_lengths.min() != series_lengths.max():
             raise ValueError(
                 "Check `Y_hat_df`, there are missing timestamps. All series should have the same number of predictions."
             )
 
         # -------------------------------- Match Y_hat/Y/S index order --------------------------------#
         # TODO: This is now a bit slow as we always sort.
-        S_nw = S_nw.with_columns(**{f"{id_col}_id": np.arange(len(S_nw))})
+        S_order_nw = S_nw.select(id_col).with_row_index(name=f"{id_col}_id")
 
-        Y_hat_nw = Y_hat_nw.join(S_nw[[id_col, f"{id_col}_id"]], on=id_col, how="left")
+        Y_hat_nw = Y_hat_nw.join(S_order_nw, on=id_col, how="left")
         Y_hat_nw = Y_hat_nw.sort(by=[f"{id_col}_id", time_col])
-        Y_hat_nw = Y_hat_nw[Y_hat_nw_cols]
+        Y_hat_nw = Y_hat_nw.drop(f"{id_col}_id")
 
         if Y_nw is not None:
-            Y_nw_cols = Y_nw.columns
-            Y_nw = Y_nw.join(S_nw[[id_col, f"{id_col}_id"]], on=id_col, how="left")
+            Y_nw = Y_nw.join(S_order_nw, on=id_col, how="left")
             Y_nw = Y_nw.sort(by=[f"{id_col}_id", time_col])
-            Y_nw = Y_nw[Y_nw_cols]
-
-        S_nw = S_nw[S_nw_cols]
+            Y_nw = Y_nw.drop(f"{id_col}_id")
 
         # ----------------------------------- Check Input's Validity ----------------------------------#
 
@@ -418,43 +531,52 @@ class HierarchicalReconciliation:
                         f"The bottom {n}x{n} part of S must be an identity matrix."
                     )
             else:
-                # Dense path (original)
-                if not np.allclose(
-                    S_bottom_nw, np.eye(len(S_nw_cols))
-                ):
+                # Dense identity check: the diagonal is 1 and holds every non-zero entry,
+                # which avoids allocating a k x k identity (and temporaries) to compare against
+                S_bottom = S_bottom_nw.to_numpy()
+                n = len(S_nw_cols)
+                is_identity = (
+                    S_bottom.shape == (n, n)
+                    and np.allclose(S_bottom.diagonal(), 1.0)
+                    and np.count_nonzero(S_bottom) == n
+                )
+                if not is_identity:
                     raise ValueError(
                         f"The bottom {S_nw.shape[1]}x{S_nw.shape[1]} part of S must be an identity matrix."
                     )
 
         # Check Y_hat_df\S_df series difference
         # TODO: this logic should be method specific
-        S_diff = set(S_nw[id_col]) - set(Y_hat_nw[id_col])
-        Y_hat_diff = set(Y_hat_nw[id_col]) - set(S_nw[id_col])
-        if S_diff:
+        # Anti-joins keep the comparison vectorized, only the (small) differences are materialized
+        S_ids = S_nw.select(nw.col(id_col).unique())
+        Y_hat_ids = Y_hat_nw.select(nw.col(id_col).unique())
+        S_diff = S_ids.join(Y_hat_ids, on=id_col, how="anti")
+        Y_hat_diff = Y_hat_ids.join(S_ids, on=id_col, how="anti")
+        if len(S_diff):
             raise ValueError(
-                f"There are unique_ids in S_df that are not in Y_hat_df: {reprlib.repr(S_diff)}"
+                f"There are unique_ids in S_df that are not in Y_hat_df: {reprlib.repr(set(S_diff[id_col].to_list()))}"
             )
-        if Y_hat_diff:
+        if len(Y_hat_diff):
             raise ValueError(
-                f"There are unique_ids in Y_hat_df that are not in S_df: {reprlib.repr(Y_hat_diff)}"
+                f"There are unique_ids in Y_hat_df that are not in S_df: {reprlib.repr(set(Y_hat_diff[id_col].to_list()))}"
             )
 
         if Y_nw is not None:
-            Y_diff = set(Y_nw[id_col]) - set(Y_hat_nw[id_col])
-            Y_hat_diff = set(Y_hat_nw[id_col]) - set(Y_nw[id_col])
-            if Y_diff:
+            Y_ids = Y_nw.select(nw.col(id_col).unique())
+            Y_diff = Y_ids.join(Y_hat_ids, on=id_col, how="anti")
+            Y_hat_diff = Y_hat_ids.join(Y_ids, on=id_col, how="anti")
+            if len(Y_diff):
                 raise ValueError(
-                    f"There are unique_ids in Y_df that are not in Y_hat_df: {reprlib.repr(Y_diff)}"
+                    f"There are unique_ids in Y_df that are not in Y_hat_df: {reprlib.repr(set(Y_diff[id_col].to_list()))}"
                 )
-            if Y_hat_diff:
+            if len(Y_hat_diff):
                 raise ValueError(
-                    f"There are unique_ids in Y_hat_df that are not in Y_df: {reprlib.repr(Y_hat_diff)}"
+                    f"There are unique_ids in Y_hat_df that are not in Y_df: {reprlib.repr(set(Y_hat_diff[id_col].to_list()))}"
                 )
 
         # Same Y_hat_df/S_df/Y_df's unique_ids. Order is guaranteed by sorting.
         # TODO: this logic should be method specific
-        unique_ids = Y_hat_nw[id_col].unique().to_numpy()
-        S_nw = S_nw.filter(nw.col(id_col).is_in(unique_ids))
+        S_nw = S_nw.join(Y_hat_ids, on=id_col, how="semi")
 
         return Y_hat_nw, S_nw, Y_nw, model_names, id_col
 
@@ -469,102 +591,41 @@ class HierarchicalReconciliation:
     ) -> np.ndarray:
         """Prepare Y data."""
         if is_balanced:
-            Y = Y_nw[target_col].to_numpy().reshape(len(S_nw), -1)
+            # Reshaping the contiguous 1D column row-major keeps it C-contiguous, so this only
+            # copies when the column isn't already float64
+            Y = np.ascontiguousarray(
+                Y_nw[target_col].to_numpy(), dtype=np.float64
+            ).reshape(len(S_nw), -1)
         else:
-            Y_pivot = Y_nw.pivot(
-                on=time_col, index=id_col, values=target_col, sort_columns=True
-            ).sort(by=id_col)
-            Y_pivot_cols_ex_id_col = Y_pivot.columns
-            Y_pivot_cols_ex_id_col.remove(id_col)
-
-            # TODO: check if this is the best way to do it - it's reasonably fast to ensure Y_pivot has same order as S_nw
-            pos_in_Y = np.searchsorted(
-                Y_pivot[id_col].to_numpy(), S_nw[id_col].to_numpy()
+            # Scatter the values into a (series, time) grid instead of pivoting: rows of S give the
+            # series position, the dense rank of the timestamps the time position. Missing entries stay nan.
+            Y_idx_nw = Y_nw.select(id_col, time_col, target_col).join(
+                S_nw.select(id_col).with_row_index(name=f"{id_col}_id"), on=id_col, how="left"
             )
-            Y_pivot = Y_pivot.select(nw.col(Y_pivot_cols_ex_id_col))
-            Y_pivot = Y_pivot[pos_in_Y]
-            Y = Y_pivot.to_numpy()
+            series_idx = Y_idx_nw[f"{id_col}_id"].to_numpy()
+            time_idx = Y_idx_nw[time_col].rank(method="dense").to_numpy().astype(np.intp) - 1
+            Y = np.full((len(S_nw), time_idx.max() + 1), np.nan)
+            Y[series_idx, time_idx] = Y_idx_nw[target_col].to_numpy()
 
-        # TODO: the result is a Fortran contiguous array, see if we can avoid the below copy (I don't think so)
-        Y = np.ascontiguousarray(Y, dtype=np.float64)
         return Y
 
-    def reconcile(
+    def _prepare_reconcile(
         self,
         Y_hat_df: Frame,
         tags: dict[str, np.ndarray],
-        S_df: "Frame | SMatrix" = None,
-        Y_df: Frame | None = None,
-        level: list[int] | None = None,
-        intervals_method: str = "normality",
-        num_samples: int = -1,
-        seed: int = 0,
-        is_balanced: bool = False,
-        id_col: str = "unique_id",
-        time_col: str = "ds",
-        target_col: str = "y",
-        id_time_col: str = "temporal_id",
-        temporal: bool = False,
-        diagnostics: bool = False,
-        diagnostics_atol: float = 1e-6,
-    ) -> FrameT:
-        r"""Hierarchical Reconciliation Method.
-
-        The `reconcile` method is analogous to SKLearn `fit_predict` method, it
-        applies different reconciliation techniques instantiated in the `reconcilers` list.
-
-        Most reconciliation methods can be described by the following convenient
-        linear algebra notation:
-
-        ```math
-        \tilde{\mathbf{y}}_{[a,b],\\tau} = \mathbf{S}_{[a,b][b]} \mathbf{P}_{[b][a,b]} \hat{\mathbf{y}}_{[a,b],\\tau}
-        ```
-
-        where $a, b$ represent the aggregate and bottom levels, $\mathbf{S}_{[a,b][b]}$ contains
-        the hierarchical aggregation constraints, and $\mathbf{P}_{[b][a,b]}$ varies across
-        reconciliation methods. The reconciled predictions are
-
-        ```math
-        \tilde{\mathbf{y}}_{[a,b],\tau}
-        ```
-
-        and the base predictions
-
-        ```math
-        \hat{\mathbf{y}}_{[a,b],\tau}
-        ```
-
-        Args:
-            Y_hat_df (Frame): DataFrame, base forecasts with columns ['unique_id', 'ds'] and models to reconcile.
-            tags (dict[str, np.ndarray]): Each key is a level and its value contains tags associated to that level.
-            S_df (Frame | SMatrix, optional): DataFrame or :class:`~hierarchicalforecast.utils.SMatrix` with summing matrix of size `(base, bottom)`, see [aggregate method](./utils.html#aggregate). Passing an ``SMatrix`` (from ``aggregate(..., sparse_s=True)``) avoids dense materialization. Default is None.
-            Y_df (Optional[Frame], optional): DataFrame, training set of base time series with columns `['unique_id', 'ds', 'y']`.
-                If a class of `self.reconciles` receives `y_hat_insample`, `Y_df` must include them as columns. Default is None.
-            level (Optional[list[int]], optional): positive float list [0,100), confidence levels for prediction intervals. Default is None.
-            intervals_method (str, optional): method used to calculate prediction intervals, one of `normality`, `bootstrap`, `permbu`. Default is "normality".
-            num_samples (int, optional): if positive return that many probabilistic coherent samples. Default is -1.
-            seed (int, optional): random seed for numpy generator's replicability. Default is 0.
-            is_balanced (bool, optional): wether `Y_df` is balanced, set it to True to speed things up if `Y_df` is balanced. Default is False.
-            id_col (str, optional): column that identifies each serie. Default is "unique_id".
-            time_col (str, optional): column that identifies each timestep, its values can be timestamps or integers. Default is "ds".
-            target_col (str, optional): column that contains the target. Default is "y".
-            id_time_col (str, optional): column that identifies each temporal aggregation level (required when `temporal=True`). Default is "temporal_id".
-            temporal (bool, optional): if True, perform temporal reconciliation. Default is False.
-            diagnostics (bool, optional): if True, compute coherence diagnostics and store in `self.diagnostics`. Default is False.
-            diagnostics_atol (float, optional): absolute tolerance for numerical coherence check. Default is 1e-6.
-
-        Returns:
-            (FrameT): DataFrame, with reconciled predictions.
-
-        Note:
-            When `diagnostics=True`, after reconciliation completes, `self.diagnostics` will contain
-            a DataFrame with coherence metrics per hierarchical level, including:
-            - `coherence_residual_mae_before/after`: Mean absolute coherence residual before/after reconciliation
-            - `adjustment_mae/rmse/max/mean`: Statistics on the adjustments made by reconciliation
-            - `negative_count_before/after`: Count of negative values before/after reconciliation
-            - `is_coherent`: Whether reconciled forecasts satisfy aggregation constraints (Overall level only)
-            - `coherence_max_violation`: Maximum coherence violation (Overall level only)
-        """
+        S_df: "Frame | SMatrix",
+        Y_df: Frame | None,
+        level: list[int] | None,
+        intervals_method: str,
+        is_balanced: bool,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        id_time_col: str,
+        temporal: bool,
+        diagnostics: bool,
+    ) -> dict:
+        """Validates inputs and precomputes the seed independent reconciliation inputs."""
         # To Narwhals
         Y_hat_nw = nw.from_native(Y_hat_df)
         # Accept SMatrix or DataFrame for S_df
@@ -621,33 +682,38 @@ class HierarchicalReconciliation:
 
         reconciler_args = dict(
             idx_bottom=np.arange(n_series)[-n_bottom:],
-            tags={
-                key: S_nw.with_columns(nw.col(id_col).is_in(val).alias("in_cols"))[
-                    "in_cols"
-                ]
-                .to_numpy()
-                .nonzero()[0]
-                for key, val in tags.items()
-            },
+            tags=_tags_to_positions(S_nw=S_nw, tags=tags, id_col=id_col),
         )
 
         any_sparse = any([method.is_sparse_method for method in self.reconcilers])
+        S_for_sparse = None
+        S_dense = None
+
+        # Dense S is shared by dense reconcilers, the strict hierarchy check and diagnostics
+        any_dense = not all(method.is_sparse_method for method in self.reconcilers)
+        if any_dense or diagnostics:
+            if _s_matrix is not None:
+                S_dense = _s_matrix.to_dense()
+            else:
+                S_dense = np.ascontiguousarray(
+                    S_nw.select(nw.col(S_nw_cols_ex_id_col)).to_numpy(),
+                    dtype=np.float64,
+                )
 
         # Fast path: when S_df was an SMatrix, extract sparse/dense directly
         if any_sparse:
             if _s_matrix is not None:
                 S_for_sparse = _s_matrix.to_csr()
             else:
-                try:
-                    S_for_sparse = sparse.csr_matrix(
-                        S_nw.select(nw.col(S_nw_cols_ex_id_col)).to_native().sparse.to_coo()
-                    )
-                except AttributeError:
-                    S_for_sparse = sparse.csr_matrix(
-                        S_nw.select(nw.col(S_nw_cols_ex_id_col))
-                        .to_numpy()
-                        .astype(np.float64, copy=False)
-                    )
+                S_values_nw = S_nw.select(nw.col(S_nw_cols_ex_id_col))
+                S_sparse_accessor = getattr(S_values_nw.to_native(), "sparse", None)
+                if S_sparse_accessor is not None:
+                    S_for_sparse = sparse.csr_matrix(S_sparse_accessor.to_coo())
+                elif S_dense is not None:
+                    S_for_sparse = sparse.csr_matrix(S_dense)
+                else:
+                    S_for_sparse = _frame_to_csr(S_values_nw)
+
         if Y_nw is not None:
             y_insample = self._prepare_Y(
                 Y_nw=Y_nw,
@@ -678,15 +744,7 @@ class HierarchicalReconciliation:
                 is_valid_hierarchy = _is_strictly_hierarchical(A, reconciler_args["tags"])
             else:
                 # Use dense check with summing matrix
-                if _s_matrix is not None:
-                    S_numpy = _s_matrix.to_dense()
-                else:
-                    S_numpy = (
-                        S_nw.select(nw.col(S_nw_cols_ex_id_col))
-                        .to_numpy()
-                        .astype(np.float64, copy=False)
-                    )
-                is_valid_hierarchy = is_strictly_hierarchical(S_numpy, reconciler_args["tags"])
+                is_valid_hierarchy = is_strictly_hierarchical(S_dense, reconciler_args["tags"])
 
             # Raise error if hierarchy is not valid
             if not is_valid_hierarchy:
@@ -699,143 +757,226 @@ class HierarchicalReconciliation:
                     f"(e.g., BottomUp, MinTrace, or ERM) that supports grouped hierarchies."
                 )
 
-        Y_tilde_nw = nw.maybe_reset_index(Y_hat_nw.clone())
-        self.execution_times = {}
-        self.level_names = {}
-        self.sample_names = {}
-        for reconciler in self.reconcilers:
-            reconcile_fn_name = _build_fn_name(reconciler)
-
-            if reconciler.is_sparse_method:
-                reconciler_args["S"] = S_for_sparse
-            else:
-                if _s_matrix is not None:
-                    reconciler_args["S"] = _s_matrix.to_dense()
-                else:
-                    reconciler_args["S"] = (
-                        S_nw.select(nw.col(S_nw_cols_ex_id_col))
-                        .to_numpy()
-                        .astype(np.float64, copy=False)
-                    )
-
-            for model_name in self.model_names:
-                start = time.time()
-                recmodel_name = f"{model_name}/{reconcile_fn_name}"
-
-                model_cols = [id_col, time_col, model_name]
+        # Base forecasts only depend on the model, so prepare them once and share them across reconcilers
+        y_hat_cache = {}
+        y_hat_insample_cache = {}
+        sigmah_cache = {}
+        estimate_sigmah = level is not None and intervals_method in ["normality", "permbu"]
+        if estimate_sigmah:
+            pi_columns = _get_pi_columns(Y_hat_nw.columns, self.model_names)
+        for model_name in self.model_names:
+            model_cols = [id_col, time_col, model_name]
+
+            # TODO: the below should be method specific
+            y_hat_cache[model_name] = self._prepare_Y(
+                Y_nw=Y_hat_nw[model_cols],
+                S_nw=S_nw,
+                is_balanced=True,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=model_name,
+            )
 
-                # TODO: the below should be method specific
-                y_hat = self._prepare_Y(
-                    Y_nw=Y_hat_nw[model_cols],
+            if Y_nw is not None and model_name in Y_nw.columns:
+                y_hat_insample_cache[model_name] = self._prepare_Y(
+                    Y_nw=Y_nw[model_cols],
                     S_nw=S_nw,
-                    is_balanced=True,
+                    is_balanced=is_balanced,
                     id_col=id_col,
                     time_col=time_col,
                     target_col=model_name,
                 )
-                reconciler_args["y_hat"] = y_hat
-
-                if Y_nw is not None and model_name in Y_nw.columns:
-                    y_hat_insample = self._prepare_Y(
-                        Y_nw=Y_nw[model_cols],
-                        S_nw=S_nw,
-                        is_balanced=is_balanced,
-                        id_col=id_col,
-                        time_col=time_col,
-                        target_col=model_name,
-                    )
-                    reconciler_args["y_hat_insample"] = y_hat_insample
-
-                if level is not None:
-                    reconciler_args["intervals_method"] = intervals_method
-                    reconciler_args["num_samples"] = 200
-                    reconciler_args["seed"] = seed
-
-                    if intervals_method in ["normality", "permbu"]:
-                        sigmah = _estimate_sigmah(
-                            Y_hat_df=Y_hat_nw,
-                            y_hat=y_hat,
-                            model_name=model_name,
-                            id_col=id_col,
-                        )
-                        reconciler_args["sigmah"] = sigmah
-
-                # Mean and Probabilistic reconciliation
-                kwargs_ls = [
-                    key
-                    for key in signature(reconciler.fit_predict).parameters
-                    if key in reconciler_args.keys()
-                ]
-                kwargs = {key: reconciler_args[key] for key in kwargs_ls}
-
-                fcsts_model = reconciler(**kwargs, level=level)
-
-                # Validate reconciler state for sampling (fail fast before processing results)
-                if num_samples > 0 and level is not None:
-                    if not getattr(reconciler, "fitted", False):
-                        raise ValueError(
-                            f"Reconciler {reconcile_fn_name} does not support sampling. "
-                            "Set num_samples=0 or use a different reconciler."
-                        )
-                    if getattr(reconciler, "sampler", None) is None:
-                        raise ValueError(
-                            f"Reconciler {reconcile_fn_name} does not have a sampler configured. "
-                            "Ensure intervals_method is set correctly."
-                        )
-
-                # Parse final outputs
-                Y_tilde_nw = Y_tilde_nw.with_columns(
-                    **{recmodel_name: fcsts_model["mean"].flatten()}
+
+            if estimate_sigmah:
+                sigmah_cache[model_name] = _estimate_sigmah(
+                    Y_hat_df=Y_hat_nw,
+                    y_hat=y_hat_cache[model_name],
+                    model_name=model_name,
+                    id_col=id_col,
+                    pi_columns=pi_columns[model_name],
                 )
 
-                if (
-                    intervals_method in ["bootstrap", "normality", "permbu", "conformal"]
-                    and level is not None
-                ):
-                    level.sort()
-                    lo_names = [f"{recmodel_name}-lo-{lv}" for lv in reversed(level)]
-                    hi_names = [f"{recmodel_name}-hi-{lv}" for lv in level]
-                    self.level_names[recmodel_name] = lo_names + hi_names
-                    sorted_quantiles = np.reshape(
-                        fcsts_model["quantiles"], (len(Y_tilde_nw), -1)
-                    )
-                    y_tilde = dict(
-                        zip(self.level_names[recmodel_name], sorted_quantiles.T, strict=False)
-                    )
-                    Y_tilde_nw = Y_tilde_nw.with_columns(**y_tilde)
+        return dict(
+            Y_hat_nw=Y_hat_nw,
+            # Names only depend on the construction parameters, so build them once per call
+            reconciler_names=[_build_fn_name(r) for r in self.reconcilers],
+            reconciler_args=reconciler_args,
+            S_for_sparse=S_for_sparse,
+            S_dense=S_dense,
+            y_hat_cache=y_hat_cache,
+            y_hat_insample_cache=y_hat_insample_cache,
+            sigmah_cache=sigmah_cache,
+        )
+
+    def _reconcile_model(
+        self,
+        reconciler: HReconciler,
+        reconcile_fn_name: str,
+        model_name: str,
+        kwargs: dict,
+        level: list[int] | None,
+        num_samples: int,
+        n_rows: int,
+    ) -> tuple[dict[str, np.ndarray], list[str] | None, list[str] | None, float]:
+        """Reconciles the base forecasts of a single model with a single reconciler.
+
+        Returns:
+            Reconciled columns, interval column names, sample column names and elapsed time.
+        """
+        start = time.time()
+        recmodel_name = f"{model_name}/{reconcile_fn_name}"
+
+        # Mean and Probabilistic reconciliation
+        fcsts_model = reconciler(**kwargs, level=level)
+
+        # Validate reconciler state for sampling (fail fast before processing results)
+        if num_samples > 0 and level is not None:
+            if not getattr(reconciler, "fitted", False):
+                raise ValueError(
+                    f"Reconciler {reconcile_fn_name} does not support sampling. "
+                    "Set num_samples=0 or use a different reconciler."
+                )
+            if getattr(reconciler, "sampler", None) is None:
+                raise ValueError(
+                    f"Reconciler {reconcile_fn_name} does not have a sampler configured. "
+                    "Ensure intervals_method is set correctly."
+                )
+
+        # Parse final outputs
+        model_cols = {recmodel_name: fcsts_model["mean"].flatten()}
+        level_names = None
+        sample_names = None
+
+        if level is not None:
+            lo_names = [f"{recmodel_name}-lo-{lv}" for lv in reversed(level)]
+            hi_names = [f"{recmodel_name}-hi-{lv}" for lv in level]
+            level_names = lo_names + hi_names
+            sorted_quantiles = np.reshape(fcsts_model["quantiles"], (n_rows, -1))
+            model_cols.update(zip(level_names, sorted_quantiles.T, strict=False))
+
+            if num_samples > 0:
+                samples = reconciler.sample(num_samples=num_samples)
+                sample_names = [f"{recmodel_name}-sample-{i}" for i in range(num_samples)]
+                samples = np.reshape(samples, (n_rows, -1))
+                model_cols.update(zip(sample_names, samples.T, strict=False))
+
+        return model_cols, level_names, sample_names, time.time() - start
 
-                    if num_samples > 0:
-                        samples = reconciler.sample(num_samples=num_samples)
-                        self.sample_names[recmodel_name] = [
-                            f"{recmodel_name}-sample-{i}" for i in range(num_samples)
-                        ]
-                        samples = np.reshape(samples, (len(Y_tilde_nw), -1))
-                        y_tilde = dict(zip(self.sample_names[recmodel_name], samples.T, strict=False))
-                        Y_tilde_nw = Y_tilde_nw.with_columns(**y_tilde)
+    def _reconcile_columns(
+        self,
+        prepared: dict,
+        level: list[int] | None,
+        intervals_method: str,
+        num_samples: int,
+        seed: int,
+    ) -> dict[str, np.ndarray]:
+        """Runs the reconcilers over inputs precomputed by `_prepare_reconcile`.
+
+        Returns:
+            Reconciled columns, in output order, keyed by column name.
+        """
+        n_rows = len(prepared["Y_hat_nw"])
+        S_for_sparse = prepared["S_for_sparse"]
+        S_dense = prepared["S_dense"]
+        y_hat_cache = prepared["y_hat_cache"]
+        y_hat_insample_cache = prepared["y_hat_insample_cache"]
+        sigmah_cache = prepared["sigmah_cache"]
+        reconciler_args = dict(prepared["reconciler_args"])
+
+        if level is not None:
+            level.sort()
+            reconciler_args["intervals_method"] = intervals_method
+            reconciler_args["num_samples"] = 200
+            reconciler_args["seed"] = seed
+
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        n_jobs = max(1, min(n_jobs, len(self.model_names)))
+
+        # Reconciled columns are collected so the caller can add them to the output in a single call
+        y_tilde_cols = {}
+        self.execution_times = {}
+        self.level_names = {}
+        self.sample_names = {}
+        for reconciler, reconcile_fn_name in zip(
+            self.reconcilers, prepared["reconciler_names"], strict=True
+        ):
+            reconciler_args["S"] = S_for_sparse if reconciler.is_sparse_method else S_dense
+            # Inspecting the signature is slow and doesn't depend on the model
+            fit_predict_params = list(signature(reconciler.fit_predict).parameters)
+
+            def reconcile_model(model_name, reconciler):
+                kwargs = dict(reconciler_args)
+                kwargs["y_hat"] = y_hat_cache[model_name]
+                if model_name in y_hat_insample_cache:
+                    kwargs["y_hat_insample"] = y_hat_insample_cache[model_name]
+                if model_name in sigmah_cache:
+                    kwargs["sigmah"] = sigmah_cache[model_name]
+                return self._reconcile_model(
+                    reconciler=reconciler,
+                    reconcile_fn_name=reconcile_fn_name,
+                    model_name=model_name,
+                    kwargs={key: val for key, val in kwargs.items() if key in fit_predict_params},
+                    level=level,
+                    num_samples=num_samples,
+                    n_rows=n_rows,
+                )
+
+            if n_jobs == 1:
+                results = [reconcile_model(model_name, reconciler) for model_name in self.model_names]
+            else:
+                # fit_predict stores the fitted state on the reconciler, so every model but the last one
+                # runs on a shallow copy and the user's reconciler keeps the last fit, as in the serial loop
+                reconcilers = [copy.copy(reconciler) for _ in self.model_names[:-1]] + [reconciler]
+                with ThreadPoolExecutor(n_jobs) as executor:
+                    results = list(executor.map(reconcile_model, self.model_names, reconcilers))
+
+            for model_name, (model_cols, level_names, sample_names, elapsed) in zip(
+                self.model_names, results, strict=True
+            ):
+                recmodel_name = f"{model_name}/{reconcile_fn_name}"
+                y_tilde_cols.update(model_cols)
+                if level_names is not None:
+                    self.level_names[recmodel_name] = level_names
+                if sample_names is not None:
+                    self.sample_names[recmodel_name] = sample_names
+                self.execution_times[recmodel_name] = elapsed
+
+        return y_tilde_cols
+
+    def _run_reconcile(
+        self,
+        prepared: dict,
+        level: list[int] | None,
+        intervals_method: str,
+        num_samples: int,
+        seed: int,
+        diagnostics: bool,
+        diagnostics_atol: float,
+    ) -> FrameT:
+        """Runs the reconcilers and builds the output frame, with optional diagnostics."""
+        Y_hat_nw = prepared["Y_hat_nw"]
+        S_dense = prepared["S_dense"]
+        y_tilde_cols = self._reconcile_columns(
+            prepared=prepared,
+            level=level,
+            intervals_method=intervals_method,
+            num_samples=num_samples,
+            seed=seed,
+        )
 
-                end = time.time()
-                self.execution_times[f"{model_name}/{reconcile_fn_name}"] = end - start
+        # with_columns returns a new frame, so Y_hat_nw is left untouched without a clone
+        Y_tilde_nw = nw.maybe_reset_index(Y_hat_nw).with_columns(**y_tilde_cols)
 
         # Compute diagnostics if requested
         if diagnostics:
             native_namespace = nw.get_native_namespace(Y_hat_nw)
 
-            # Prepare S matrix as dense numpy array for diagnostics
-            if _s_matrix is not None:
-                S_numpy = _s_matrix.to_dense()
-            else:
-                S_numpy = (
-                    S_nw.select(nw.col(S_nw_cols_ex_id_col))
-                    .to_numpy()
-                    .astype(np.float64, copy=False)
-                )
-
-            # Get indices - note: S_numpy has shape (n_series, n_bottom)
+            # Get indices - note: S_dense has shape (n_series, n_bottom)
             # idx_bottom should refer to the last n_bottom rows of y
-            n_series = S_numpy.shape[0]
-            n_bottom = S_numpy.shape[1]
+            n_series = S_dense.shape[0]
+            n_bottom = S_dense.shape[1]
             idx_bottom_diag = np.arange(n_series)[-n_bottom:]
-            tags_numeric = reconciler_args["tags"]
+            tags_numeric = prepared["reconciler_args"]["tags"]
 
             # Add "Overall" level
             tags_with_overall = {
@@ -854,13 +995,11 @@ class HierarchicalReconciliation:
                     Y_hat_nw[base_model_name].to_numpy().reshape(n_series, -1)
                 )
                 # Get reconciled forecasts
-                y_after = (
-                    Y_tilde_nw[recmodel_name].to_numpy().reshape(n_series, -1)
-                )
+                y_after = y_tilde_cols[recmodel_name].reshape(n_series, -1)
 
                 # Compute coherence residuals for the entire array
-                residual_before = _compute_coherence_residual(y_before, S_numpy, idx_bottom_diag)
-                residual_after = _compute_coherence_residual(y_after, S_numpy, idx_bottom_diag)
+                residual_before = _compute_coherence_residual(y_before, S_dense, idx_bottom_diag)
+                residual_after = _compute_coherence_residual(y_after, S_dense, idx_bottom_diag)
 
                 model_diagnostics: dict[str, dict[str, float]] = {}
 
@@ -892,6 +1031,108 @@ class HierarchicalReconciliation:
 
         return Y_tilde_df
 
+    def reconcile(
+        self,
+        Y_hat_df: Frame,
+        tags: dict[str, np.ndarray],
+        S_df: "Frame | SMatrix" = None,
+        Y_df: Frame | None = None,
+        level: list[int] | None = None,
+        intervals_method: str = "normality",
+        num_samples: int = -1,
+        seed: int = 0,
+        is_balanced: bool = False,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+        id_time_col: str = "temporal_id",
+        temporal: bool = False,
+        diagnostics: bool = False,
+        diagnostics_atol: float = 1e-6,
+    ) -> FrameT:
+        r"""Hierarchical Reconciliation Method.
+
+        The `reconcile` method is analogous to SKLearn `fit_predict` method, it
+        applies different reconciliation techniques instantiated in the `reconcilers` list.
+
+        Most reconciliation methods can be described by the following convenient
+        linear algebra notation:
+
+        ```math
+        \tilde{\mathbf{y}}_{[a,b],\\tau} = \mathbf{S}_{[a,b][b]} \mathbf{P}_{[b][a,b]} \hat{\mathbf{y}}_{[a,b],\\tau}
+        ```
+
+        where $a, b$ represent the aggregate and bottom levels, $\mathbf{S}_{[a,b][b]}$ contains
+        the hierarchical aggregation constraints, and $\mathbf{P}_{[b][a,b]}$ varies across
+        reconciliation methods. The reconciled predictions are
+
+        ```math
+        \tilde{\mathbf{y}}_{[a,b],\tau}
+        ```
+
+        and the base predictions
+
+        ```math
+        \hat{\mathbf{y}}_{[a,b],\tau}
+        ```
+
+        Args:
+            Y_hat_df (Frame): DataFrame, base forecasts with columns ['unique_id', 'ds'] and models to reconcile.
+            tags (dict[str, np.ndarray]): Each key is a level and its value contains tags associated to that level.
+            S_df (Frame | SMatrix, optional): DataFrame or :class:`~hierarchicalforecast.utils.SMatrix` with summing matrix of size `(base, bottom)`, see [aggregate method](./utils.html#aggregate). Passing an ``SMatrix`` (from ``aggregate(..., sparse_s=True)``) avoids dense materialization. Default is None.
+            Y_df (Optional[Frame], optional): DataFrame, training set of base time series with columns `['unique_id', 'ds', 'y']`.
+                If a class of `self.reconciles` receives `y_hat_insample`, `Y_df` must include them as columns. Default is None.
+            level (Optional[list[int]], optional): positive float list [0,100), confidence levels for prediction intervals. Default is None.
+            intervals_method (str, optional): method used to calculate prediction intervals, one of `normality`, `bootstrap`, `permbu`. Default is "normality".
+            num_samples (int, optional): if positive return that many probabilistic coherent samples. Default is -1.
+            seed (int, optional): random seed for numpy generator's replicability. Default is 0.
+            is_balanced (bool, optional): wether `Y_df` is balanced, set it to True to speed things up if `Y_df` is balanced. Default is False.
+            id_col (str, optional): column that identifies each serie. Default is "unique_id".
+            time_col (str, optional): column that identifies each timestep, its values can be timestamps or integers. Default is "ds".
+            target_col (str, optional): column that contains the target. Default is "y".
+            id_time_col (str, optional): column that identifies each temporal aggregation level (required when `temporal=True`). Default is "temporal_id".
+            temporal (bool, optional): if True, perform temporal reconciliation. Default is False.
+            diagnostics (bool, optional): if True, compute coherence diagnostics and store in `self.diagnostics`. Default is False.
+            diagnostics_atol (float, optional): absolute tolerance for numerical coherence check. Default is 1e-6.
+
+        Returns:
+            (FrameT): DataFrame, with reconciled predictions.
+
+        Note:
+            When `diagnostics=True`, after reconciliation completes, `self.diagnostics` will contain
+            a DataFrame with coherence metrics per hierarchical level, including:
+            - `coherence_residual_mae_before/after`: Mean absolute coherence residual before/after reconciliation
+            - `adjustment_mae/rmse/max/mean`: Statistics on the adjustments made by reconciliation
+            - `negative_count_before/after`: Count of negative values before/after reconciliation
+            - `is_coherent`: Whether reconciled forecasts satisfy aggregation constraints (Overall level only)
+            - `coherence_max_violation`: Maximum coherence violation (Overall level only)
+        """
+        prepared = self._prepare_reconcile(
+            Y_hat_df=Y_hat_df,
+            tags=tags,
+            S_df=S_df,
+            Y_df=Y_df,
+            level=level,
+            intervals_method=intervals_method,
+            is_balanced=is_balanced,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            id_time_col=id_time_col,
+            temporal=temporal,
+            diagnostics=diagnostics,
+        )
+
+        return self._run_reconcile(
+            prepared=prepared,
+            level=level,
+            intervals_method=intervals_method,
+            num_samples=num_samples,
+            seed=seed,
+            diagnostics=diagnostics,
+            diagnostics_atol=diagnostics_atol,
+        )
+
     def bootstrap_reconcile(
         self,
         Y_hat_df: Frame,
@@ -910,6 +1151,9 @@ class HierarchicalReconciliation:
 
         Applies N times, based on different random seeds, the `reconcile` method
         for the different reconciliation techniques instantiated in the `reconcilers` list.
+        The i-th run uses `seed=i`, which the probabilistic samplers turn into a
+        `np.random.default_rng(i)` generator. Integer seeds go through `np.random.SeedSequence`,
+        so the runs draw from statistically independent streams and remain reproducible.
 
         Args:
             Y_hat_df (Frame): DataFrame, base forecasts with columns ['unique_id', 'ds'] and models to reconcile.
@@ -920,7 +1164,7 @@ class HierarchicalReconciliation:
             level (Optional[list[int]], optional): positive float list [0,100), confidence levels for prediction intervals. Default is None.
             intervals_method (str, optional): method used to calculate prediction intervals, one of `normality`, `bootstrap`, `permbu`. Default is "normality".
             num_samples (int, optional): if positive return that many probabilistic coherent samples. Default is -1.
-            num_seeds (int, optional): random seed for numpy generator's replicability. Default is 1.
+            num_seeds (int, optional): number of reconciliations, run with seeds `0, ..., num_seeds - 1`. Default is 1.
             id_col (str, optional): column that identifies each serie. Default is "unique_id".
             time_col (str, optional): column that identifies each timestep, its values can be timestamps or integers. Default is "ds".
             target_col (str, optional): column that contains the target. Default is "y".
@@ -928,34 +1172,53 @@ class HierarchicalReconciliation:
         Returns:
             (FrameT): DataFrame, with bootstraped reconciled predictions.
         """
-        # Bootstrap reconciled predictions
-        Y_tilde_list = []
+        # Inputs are the same for every seed, validate and prepare them only once
+        prepared = self._prepare_reconcile(
+            Y_hat_df=Y_hat_df,
+            tags=tags,
+            S_df=S_df,
+            Y_df=Y_df,
+            level=level,
+            intervals_method=intervals_method,
+            is_balanced=False,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            id_time_col="temporal_id",
+            temporal=False,
+            diagnostics=False,
+        )
+
+        # Bootstrap reconciled predictions. Only the reconciled columns change across seeds, so they're
+        # written into preallocated arrays and the base columns are repeated with a single row gather
+        Y_hat_nw = nw.maybe_reset_index(prepared["Y_hat_nw"])
+        n_rows = len(Y_hat_nw)
+        y_tilde_cols = {}
         for seed in range(num_seeds):
-            Y_tilde_df = self.reconcile(
-                Y_hat_df=Y_hat_df,
-                S_df=S_df,
-                tags=tags,
-                Y_df=Y_df,
+            seed_cols = self._reconcile_columns(
+                prepared=prepared,
                 level=level,
                 intervals_method=intervals_method,
                 num_samples=num_samples,
                 seed=seed,
-                id_col=id_col,
-                time_col=time_col,
-                target_col=target_col,
             )
-            Y_tilde_nw = nw.from_native(Y_tilde_df)
-            Y_tilde_nw = Y_tilde_nw.with_columns(nw.lit(seed).alias("seed"))
-
-            # TODO: fix broken recmodel_names
-            if seed == 0:
-                first_columns = Y_tilde_nw.columns
-            Y_tilde_nw = Y_tilde_nw.rename(
-                {col: first_columns[i] for i, col in enumerate(first_columns)}
-            )
-            Y_tilde_list.append(Y_tilde_nw)
-
-        Y_bootstrap_nw = nw.concat(Y_tilde_list, how="vertical")
+            for name, values in seed_cols.items():
+                if name not in y_tilde_cols:
+                    y_tilde_cols[name] = np.empty(num_seeds * n_rows, dtype=values.dtype)
+                y_tilde_cols[name][seed * n_rows : (seed + 1) * n_rows] = values
+
+        # Keep the integer type backends give to `nw.lit(seed)`
+        seed_dtype = Y_hat_nw.select(nw.lit(0).alias("seed")).schema["seed"]
+        seed_col = nw.new_series(
+            name="seed",
+            values=np.repeat(np.arange(num_seeds), n_rows),
+            dtype=seed_dtype,
+            backend=nw.get_native_namespace(Y_hat_nw),
+        )
+        Y_bootstrap_nw = Y_hat_nw[np.tile(np.arange(n_rows), num_seeds)].with_columns(
+            **y_tilde_cols, seed=seed_col
+        )
+        self.diagnostics = None
         Y_bootstrap_df = Y_bootstrap_nw.to_native()
 
         return Y_bootstrap_df
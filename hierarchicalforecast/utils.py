@@ -1082,16 +1082,18 @@ class SMatrix:
     def check_bottom_identity(self) -> bool:
         """Check that the bottom n_bottom x n_bottom block of S is an identity matrix.
 
-        Uses sparse operations to avoid dense allocations.
+        Uses the CSR structure of the bottom rows, so the check is O(n_bottom)
+        and avoids dense allocations: every row must store exactly one entry,
+        equal to 1, on the diagonal.
         """
         n_bottom = self._sparse.shape[1]
-        bottom_block = self._sparse[-n_bottom:, :]
-        bottom_coo = bottom_block.tocoo()
+        bottom_block = sparse.csr_matrix(self._sparse[-n_bottom:, :])
         return (
-            bottom_coo.shape[0] == bottom_coo.shape[1]
-            and bottom_coo.nnz == n_bottom
-            and np.allclose(bottom_coo.data, 1.0)
-            and np.array_equal(bottom_coo.row, bottom_coo.col)
+            bottom_block.shape[0] == n_bottom
+            and bottom_block.nnz == n_bottom
+            and np.array_equal(bottom_block.indptr, np.arange(n_bottom + 1))
+            and np.array_equal(bottom_block.indices, np.arange(n_bottom))
+            and np.allclose(bottom_block.data, 1.0)
         )
 
     def clear_cache(self) -> None:
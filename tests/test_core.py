@@ -10,6 +10,9 @@ from hierarchicalforecast.core import (
     HierarchicalReconciliation,
     _build_fn_name,
     _estimate_sigmah,
+    _get_pi_columns,
+    _level_to_z,
+    _tags_to_positions,
 )
 from hierarchicalforecast.methods import (
     ERM,
@@ -122,6 +125,20 @@ def test_fn_name():
     assert _build_fn_name(MinTrace(method='ols', nonnegative=True)) == 'MinTrace_method-ols_nonnegative-True'
     assert _build_fn_name(MinTrace(method='mint_shrink')) == 'MinTrace_method-mint_shrink'
 
+def test_fn_name_without_init_params(strict_hierarchy_data):
+    """Tests that reconcilers without _init_params aren't named after their fitted state."""
+    class CustomBottomUp(BottomUp):
+        def __init__(self, scale):
+            self.scale = scale
+
+    data = strict_hierarchy_data
+    hrec = HierarchicalReconciliation([CustomBottomUp(scale=1)])
+    for _ in range(2):
+        reconciled = hrec.reconcile(
+            Y_hat_df=data["Y_hat_df"].drop(columns="y"), S_df=data["S_df"], tags=data["tags"]
+        )
+        assert list(reconciled.columns) == ["unique_id", "ds", "y_model", "y_model/CustomBottomUp_scale-1"]
+
 @pytest.mark.parametrize("lib", ["pandas", "polars"])
 def test_reconciliation_recovers_original_y(grouped_data, lib):
     """Tests if various reconciliation methods can reconstruct the original `y` values."""
@@ -1009,6 +1026,29 @@ class TestEstimateSigmah:
         sigmah = _estimate_sigmah(df, y_hat, model_name="model")
         assert np.all(sigmah >= 0)
 
+    def test_get_pi_columns(self):
+        """PI columns are paired per model and level in a single scan."""
+        columns = [
+            "unique_id", "ds", "model", "model-2",
+            "model-hi-95", "model-lo-80", "model-hi-80", "model-lo-95",
+            "model-2-lo-90", "model-2-hi-90", "model-2-lo-80", "model-median",
+        ]
+        pi_columns = _get_pi_columns(columns, ["model", "model-2", "other"])
+        assert pi_columns == {
+            "model": {80.0: ("model-lo-80", "model-hi-80"), 95.0: ("model-lo-95", "model-hi-95")},
+            "model-2": {90.0: ("model-2-lo-90", "model-2-hi-90")},
+            "other": {},
+        }
+        assert list(pi_columns["model"]) == [80.0, 95.0]
+
+    def test_level_to_z(self):
+        """Cached z-values match the normal quantile of each interval level."""
+        from scipy.stats import norm
+
+        for level in [80.0, 90.0, 95.0, 99.5]:
+            assert _level_to_z(level) == pytest.approx(norm.ppf(0.5 + level / 200))
+        assert _level_to_z(95.0) == pytest.approx(1.959964, abs=1e-6)
+
 
 # ==============================================================================
 # Tests for SMatrix integration through reconcile()
@@ -1191,3 +1231,210 @@ def test_smatrix_check_bottom_identity_rejects_bad_matrix():
             S_df=smat,
             tags={"top": np.array(["top"]), "mid": np.array(["mid"]), "bottom": np.array(["a", "b", "c"])},
         )
+
+
+def test_reconcile_multiple_models_matches_single_model(strict_hierarchy_data):
+    """Tests that sharing prepared base forecasts across reconcilers doesn't mix up models."""
+    data = strict_hierarchy_data
+    Y_hat_df = data["Y_hat_df"].drop(columns="y").assign(y_model2=lambda df: 2 * df["y_model"])
+    Y_train_df = data["Y_train_df"].assign(y_model2=lambda df: 2 * df["y_model"])
+
+    reconcilers = [BottomUp(), MinTrace(method="mint_shrink")]
+    hrec = HierarchicalReconciliation(reconcilers)
+    result = hrec.reconcile(
+        Y_hat_df=Y_hat_df, Y_df=Y_train_df, S_df=data["S_df"], tags=data["tags"]
+    )
+
+    for model in ["y_model", "y_model2"]:
+        hrec_single = HierarchicalReconciliation(reconcilers)
+        expected = hrec_single.reconcile(
+            Y_hat_df=Y_hat_df[["unique_id", "ds", model]],
+            Y_df=Y_train_df[["unique_id", "ds", "y", model]],
+            S_df=data["S_df"],
+            tags=data["tags"],
+        )
+        for reconciler in reconcilers:
+            col = f"{model}/{_build_fn_name(reconciler)}"
+            np.testing.assert_allclose(result[col].values, expected[col].values)
+
+
+def test_reconcile_n_jobs_matches_serial(strict_hierarchy_data):
+    """Tests that reconciling models in threads gives the same output as the serial loop."""
+    data = strict_hierarchy_data
+    Y_hat_df = data["Y_hat_df"].drop(columns="y")
+    Y_train_df = data["Y_train_df"]
+    for i, scale in enumerate([1.1, 0.9, 1.2], start=2):
+        Y_hat_df[f"y_model{i}"] = scale * Y_hat_df["y_model"]
+        Y_train_df = Y_train_df.assign(**{f"y_model{i}": scale * Y_train_df["y_model"]})
+    for model in ["y_model", "y_model2", "y_model3", "y_model4"]:
+        Y_hat_df[f"{model}-lo-90"] = 0.9 * Y_hat_df[model]
+        Y_hat_df[f"{model}-hi-90"] = 1.1 * Y_hat_df[model]
+    kwargs = dict(
+        Y_hat_df=Y_hat_df, Y_df=Y_train_df, S_df=data["S_df"], tags=data["tags"],
+        level=[80, 90], intervals_method="normality", num_samples=4,
+    )
+
+    reconcilers = [BottomUp(), MinTrace(method="mint_shrink")]
+    serial = HierarchicalReconciliation(reconcilers).reconcile(**kwargs)
+    hrec = HierarchicalReconciliation(reconcilers, n_jobs=2)
+    threaded = hrec.reconcile(**kwargs)
+
+    pd.testing.assert_frame_equal(threaded, serial)
+    assert list(hrec.execution_times) == [
+        f"{model}/{_build_fn_name(reconciler)}"
+        for reconciler in reconcilers
+        for model in hrec.model_names
+    ]
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_reconcile_raises_on_mismatched_unique_ids(strict_hierarchy_data, lib):
+    """Tests the unique_id consistency checks between Y_hat_df, S_df and Y_df."""
+    data = strict_hierarchy_data
+    Y_hat_df, Y_train_df, S_df = data["Y_hat_df"], data["Y_train_df"], data["S_df"]
+    not_top = lambda df: df[df["unique_id"] != "AU"]  # noqa: E731
+    cases = [
+        (dict(Y_hat_df=not_top(Y_hat_df), S_df=S_df), "unique_ids in S_df that are not in Y_hat_df: {'AU'}"),
+        (dict(Y_hat_df=Y_hat_df, S_df=not_top(S_df)), "unique_ids in Y_hat_df that are not in S_df: {'AU'}"),
+        (dict(Y_hat_df=Y_hat_df, S_df=S_df, Y_df=not_top(Y_train_df)), "unique_ids in Y_hat_df that are not in Y_df: {'AU'}"),
+    ]
+    for kwargs, msg in cases:
+        if lib == "polars":
+            kwargs = {key: pl.from_pandas(df) for key, df in kwargs.items()}
+        hrec = HierarchicalReconciliation([BottomUp()])
+        with pytest.raises(ValueError, match=msg):
+            hrec.reconcile(tags=data["tags"], **kwargs)
+
+
+def test_bootstrap_reconcile_matches_reconcile_per_seed(strict_hierarchy_data):
+    """Tests that preparing the inputs once in bootstrap_reconcile keeps each seed's output."""
+    data = strict_hierarchy_data
+    Y_hat_df = data["Y_hat_df"].drop(columns="y").assign(
+        **{"y_model-lo-90": lambda df: df["y_model"] - 5, "y_model-hi-90": lambda df: df["y_model"] + 5}
+    )
+    kwargs = dict(
+        Y_hat_df=Y_hat_df,
+        Y_df=data["Y_train_df"],
+        S_df=data["S_df"],
+        tags=data["tags"],
+        level=[80, 90],
+        intervals_method="normality",
+        num_samples=5,
+    )
+    hrec = HierarchicalReconciliation([BottomUp(), MinTrace(method="ols")])
+    bootstrap_df = hrec.bootstrap_reconcile(num_seeds=2, **kwargs)
+
+    for seed in range(2):
+        expected = HierarchicalReconciliation(
+            [BottomUp(), MinTrace(method="ols")]
+        ).reconcile(seed=seed, **kwargs)
+        result = bootstrap_df[bootstrap_df["seed"] == seed].drop(columns="seed")
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+
+    # Seeds draw different samples, and rerunning reproduces them
+    sample_cols = [col for col in bootstrap_df.columns if "-sample-" in col]
+    samples = bootstrap_df.groupby("seed")[sample_cols]
+    assert not np.allclose(samples.get_group(0).to_numpy(), samples.get_group(1).to_numpy())
+    pd.testing.assert_frame_equal(hrec.bootstrap_reconcile(num_seeds=2, **kwargs), bootstrap_df)
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_sparse_only_reconcilers_match_dense(strict_hierarchy_data, lib):
+    """Tests sparse reconcilers when S_df is a dense frame and no dense S is requested."""
+    data = strict_hierarchy_data
+    Y_hat_df, Y_train_df, S_df = data["Y_hat_df"], data["Y_train_df"], data["S_df"]
+    if lib == "polars":
+        Y_hat_df, Y_train_df, S_df = pl.from_pandas(Y_hat_df), pl.from_pandas(Y_train_df), pl.from_pandas(S_df)
+
+    kwargs = dict(Y_hat_df=Y_hat_df, Y_df=Y_train_df, S_df=S_df, tags=data["tags"])
+    sparse_df = nw.from_native(
+        HierarchicalReconciliation([BottomUpSparse(), MinTraceSparse(method="wls_struct")]).reconcile(**kwargs)
+    )
+    dense_df = nw.from_native(
+        HierarchicalReconciliation([BottomUp(), MinTrace(method="wls_struct")]).reconcile(**kwargs)
+    )
+    np.testing.assert_allclose(sparse_df["y_model/BottomUpSparse"], dense_df["y_model/BottomUp"])
+    np.testing.assert_allclose(
+        sparse_df["y_model/MinTraceSparse_method-wls_struct"],
+        dense_df["y_model/MinTrace_method-wls_struct"],
+        rtol=1e-4,
+    )
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_prepare_y_unbalanced(lib):
+    """Tests that unbalanced series are laid out in S order with nan for missing timestamps."""
+    Y_df = pd.DataFrame({
+        "unique_id": ["b", "a", "b", "c", "a", "b"],
+        "ds": [3, 2, 1, 3, 1, 2],
+        "y": [6.0, 2.0, 4.0, 9.0, 1.0, 5.0],
+    })
+    S_df = pd.DataFrame({"unique_id": ["c", "a", "b"]})
+    if lib == "polars":
+        Y_df, S_df = pl.from_pandas(Y_df), pl.from_pandas(S_df)
+
+    hrec = HierarchicalReconciliation([BottomUp()])
+    Y = hrec._prepare_Y(Y_nw=nw.from_native(Y_df), S_nw=nw.from_native(S_df), is_balanced=False)
+
+    expected = np.array([
+        [np.nan, np.nan, 9.0],
+        [1.0, 2.0, np.nan],
+        [4.0, 5.0, 6.0],
+    ])
+    np.testing.assert_array_equal(Y, expected)
+    assert Y.flags.c_contiguous
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_tags_to_positions(lib):
+    """Tests that tags are mapped to sorted, unique row positions in S."""
+    S_df = pd.DataFrame({"unique_id": ["total", "a", "b", "c"]})
+    if lib == "polars":
+        S_df = pl.from_pandas(S_df)
+    tags = {
+        "level1": np.array(["total"]),
+        "level2": np.array(["c", "a", "c", "missing"], dtype=object),
+        "empty": np.array([], dtype=object),
+    }
+
+    tags_idx = _tags_to_positions(S_nw=nw.from_native(S_df), tags=tags)
+
+    assert list(tags_idx) == ["level1", "level2", "empty"]
+    np.testing.assert_array_equal(tags_idx["level1"], [0])
+    np.testing.assert_array_equal(tags_idx["level2"], [1, 3])
+    assert tags_idx["empty"].size == 0
+    assert _tags_to_positions(S_nw=nw.from_native(S_df), tags={}) == {}
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_reconcile_does_not_modify_input(strict_hierarchy_data, lib):
+    """Tests that reconcile leaves the base forecasts frame untouched."""
+    data = strict_hierarchy_data
+    Y_hat_df, S_df = data["Y_hat_df"], data["S_df"]
+    if lib == "polars":
+        Y_hat_df, S_df = pl.from_pandas(Y_hat_df), pl.from_pandas(S_df)
+    Y_hat_before = Y_hat_df.clone() if lib == "polars" else Y_hat_df.copy()
+
+    hrec = HierarchicalReconciliation([BottomUp(), MinTrace(method="ols")])
+    Y_rec_df = hrec.reconcile(Y_hat_df=Y_hat_df, S_df=S_df, tags=data["tags"])
+
+    assert Y_rec_df is not Y_hat_df
+    assert list(Y_hat_df.columns) == list(Y_hat_before.columns)
+    if lib == "polars":
+        assert Y_hat_df.equals(Y_hat_before)
+    else:
+        pd.testing.assert_frame_equal(Y_hat_df, Y_hat_before)
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_reconcile_raises_on_missing_timestamps(strict_hierarchy_data, lib):
+    """Tests that Y_hat_df series with different number of predictions are rejected."""
+    data = strict_hierarchy_data
+    Y_hat_df = data["Y_hat_df"].iloc[1:]
+    S_df = data["S_df"]
+    if lib == "polars":
+        Y_hat_df, S_df = pl.from_pandas(Y_hat_df), pl.from_pandas(S_df)
+
+    hrec = HierarchicalReconciliation([BottomUp()])
+    with pytest.raises(ValueError, match="there are missing timestamps"):
+        hrec.reconcile(Y_hat_df=Y_hat_df, S_df=S_df, tags=data["tags"])
@@ -631,6 +631,35 @@ def test_smatrix_clear_cache():
     np.testing.assert_array_equal(dense, np.eye(3))
 
 
+def test_smatrix_check_bottom_identity():
+    """Tests that check_bottom_identity() only accepts an exact identity bottom block."""
+    from scipy import sparse as sp
+
+    from hierarchicalforecast.utils import SMatrix
+
+    def make_smatrix(data):
+        return SMatrix(
+            sparse_matrix=sp.csc_matrix(np.asarray(data, dtype=np.float64)),
+            row_labels=np.array(["top", "a", "b", "c"]),
+            col_labels=np.array(["a", "b", "c"]),
+        )
+
+    valid = [[1, 1, 1], [1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    assert make_smatrix(valid).check_bottom_identity()
+
+    # Extra off-diagonal entry
+    extra = [[1, 1, 1], [1, 1, 0], [0, 1, 0], [0, 0, 1]]
+    assert not make_smatrix(extra).check_bottom_identity()
+
+    # Permuted rows
+    permuted = [[1, 1, 1], [0, 1, 0], [1, 0, 0], [0, 0, 1]]
+    assert not make_smatrix(permuted).check_bottom_identity()
+
+    # Non-unit diagonal
+    scaled = [[1, 1, 1], [2, 0, 0], [0, 1, 0], [0, 0, 1]]
+    assert not make_smatrix(scaled).check_bottom_identity()
+
+
 def test_cov_equivalence():
     # test covariance equivalence
     n_samples = 100